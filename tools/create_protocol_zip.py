@@ -9,13 +9,62 @@ import os
 import sys
 import zipfile
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 import json
+import shutil
 import subprocess
 from PIL import Image, ImageDraw, ImageFont
 import io
 
+# Files at or above this size are streamed into the hasher instead of read whole
+STREAM_HASH_THRESHOLD = 1 << 20
+
+# Below this much content, files are hashed serially rather than on a thread pool
+PARALLEL_HASH_MIN_BYTES = 8 << 20
+
+# Already-compressed formats gain nothing from deflate, so they are stored as-is
+STORED_SUFFIXES = {'.png', '.jpg', '.jpeg', '.gif', '.webp', '.zip', '.gz', '.mcpb'}
+# Low deflate level: near-default ratio on text at a fraction of the CPU cost
+DEFLATE_LEVEL = 3
+# Read size when copying files into the archive (zipfile.write uses 8 KiB)
+ZIP_COPY_BUFFER = 1 << 20
+
+def _update_hasher_from_file(hasher, f):
+    """Stream an open binary file into an existing hasher without loading it into memory"""
+    if hasattr(hashlib, 'file_digest'):
+        # Python 3.11+: hashes in a C-level loop; the factory hands back our running hasher
+        hashlib.file_digest(f, lambda: hasher)
+        return
+    # Python 3.10 fallback: reuse a single buffer to avoid per-chunk allocation
+    buf = bytearray(STREAM_HASH_THRESHOLD)
+    view = memoryview(buf)
+    while True:
+        n = f.readinto(buf)
+        if not n:
+            break
+        hasher.update(view[:n])
+
+def _hash_file(file_path, size):
+    """Return the SHA-256 digest of a single file"""
+    hasher = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        if size < STREAM_HASH_THRESHOLD:
+            hasher.update(f.read())
+        else:
+            _update_hasher_from_file(hasher, f)
+    return hasher.digest()
+
+def _walk_files(root):
+    """Recursively yield DirEntry objects for every file under root"""
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path)
+            elif entry.is_file():
+                yield entry
+
 class SoulSketchZipCreator:
     def __init__(self, repo_path):
         self.repo_path = Path(repo_path)
@@ -24,10 +73,6 @@ class SoulSketchZipCreator:
         
     def generate_unique_thumbnail(self, zip_path, content_hash):
         """Generate a unique thumbnail based on content hash and timestamp"""
-        # Create a 256x256 thumbnail with SoulSketch theme
-        img = Image.new('RGB', (256, 256), color='#0f0f23')
-        draw = ImageDraw.Draw(img)
-        
         # Use content hash to generate unique colors and patterns
         hash_int = int(content_hash[:8], 16)
         
@@ -38,40 +83,47 @@ class SoulSketchZipCreator:
             min(255, (hash_int & 0xFF) + 80)
         )
         
-        # Create ethereal gradient background
-        for y in range(256):
-            gradient_factor = y / 256
-            gradient_color = tuple(
-                int(c * (1 - gradient_factor) + 0x23 * gradient_factor) for c in primary_color
-            )
-            draw.line([(0, y), (256, y)], fill=gradient_color)
+        # Create a 256x256 thumbnail with an ethereal gradient background:
+        # one pixel per row colour, stretched across the width in a single resize
+        gradient = Image.new('RGB', (1, 256))
+        gradient.putdata([
+            tuple(int(c * (1 - y / 256) + 0x23 * (y / 256)) for c in primary_color)
+            for y in range(256)
+        ])
+        img = gradient.resize((256, 256), Image.NEAREST)
+        draw = ImageDraw.Draw(img)
         
         # Draw soul-sketch pattern based on hash
         pattern_seed = hash_int % 6
         if pattern_seed == 0:
             # Flowing curves (soul paths)
             for i in range(4):
+                # Per-curve constants, hoisted out of the point loop
+                x_offset = 20 + (hash_int >> (i*2)) % 40
+                curve_bits = hash_int >> (i*3)
                 points = []
                 for j in range(20):
-                    x = j * 12 + 20 + (hash_int >> (i*2)) % 40
-                    y = 128 + 50 * (hash_int >> (i*3+j)) % 3 - 1
+                    x = j * 12 + x_offset
+                    y = 128 + 50 * (curve_bits >> j) % 3 - 1
                     points.append((x, y))
-                if len(points) > 1:
-                    for k in range(len(points)-1):
-                        draw.line([points[k], points[k+1]], fill='white', width=2)
+                # One polyline call per curve instead of one call per segment
+                draw.line(points, fill='white', width=2)
         elif pattern_seed == 1:
             # Interconnected nodes (soul network)
             nodes = []
             for i in range(8):
-                x = 50 + (hash_int >> (i*4)) % 156
-                y = 50 + (hash_int >> (i*4+2)) % 156
+                node_bits = hash_int >> (i*4)
+                x = 50 + node_bits % 156
+                y = 50 + (node_bits >> 2) % 156
                 nodes.append((x, y))
                 draw.ellipse([x-8, y-8, x+8, y+8], fill='white')
             
-            # Connect nodes
-            for i in range(len(nodes)):
-                for j in range(i+1, min(i+3, len(nodes))):
-                    draw.line([nodes[i], nodes[j]], fill='white', width=1)
+            # Connect each node to the next two. Those edges form a single
+            # path n1-n0-n2-n1-n3-n2-...-n7-n6, drawn as one polyline
+            path = [nodes[1], nodes[0]]
+            for k in range(2, len(nodes)):
+                path.extend((nodes[k], nodes[k-1]))
+            draw.line(path, fill='white', width=1)
         else:
             # Geometric soul patterns
             center_x, center_y = 128, 128
@@ -94,20 +146,78 @@ class SoulSketchZipCreator:
         draw.text((10, 220), self.timestamp, fill='white', font=font)
         draw.text((10, 200), f"Hash: {content_hash[:8]}", fill='white', font=font)
         
-        # Save thumbnail
+        # Save thumbnail; it is decorative, so favour encode speed over size
         thumbnail_path = zip_path.with_suffix('.png')
-        img.save(thumbnail_path)
+        img.save(thumbnail_path, format='PNG', compress_level=1, optimize=False)
         print(f"✅ Generated unique thumbnail: {thumbnail_path.name}")
         return thumbnail_path
         
+    def collect_files(self, files_to_include):
+        """Walk the included paths once, returning (path, arcname, size, mtime_ns) for each file"""
+        files_to_zip = []
+        for item in files_to_include:
+            item_path = self.repo_path / item
+            if item_path.is_file():
+                st = item_path.stat()
+                files_to_zip.append((item_path, item_path.relative_to(self.repo_path),
+                                     st.st_size, st.st_mtime_ns))
+            elif item_path.is_dir():
+                for entry in _walk_files(item_path):
+                    file_path = Path(entry.path)
+                    # DirEntry caches stat results from the directory scan
+                    st = entry.stat()
+                    files_to_zip.append((file_path, file_path.relative_to(self.repo_path),
+                                         st.st_size, st.st_mtime_ns))
+        return files_to_zip
+        
+    def calculate_content_signature(self, files_to_zip):
+        """Cheap change detector over (arcname, mtime, size), without reading any file"""
+        hasher = hashlib.blake2b(digest_size=16)
+        for _, arcname, size, mtime_ns in sorted(files_to_zip, key=lambda f: str(f[1])):
+            hasher.update(f"{arcname}\0{mtime_ns}\0{size}\n".encode())
+        return hasher.hexdigest()
+        
+    def find_unchanged_pack(self, content_signature):
+        """Return paths of the newest pack if its recorded signature matches, else None"""
+        previous = sorted(self.repo_path.glob("SoulSketch_Protocol_*.json"))
+        if not previous:
+            return None
+        metadata_path = previous[-1]
+        try:
+            with open(metadata_path) as f:
+                metadata = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if metadata.get("content_signature") != content_signature:
+            return None
+        zip_path = metadata_path.with_suffix('.zip')
+        # A missing or malformed thumbnail name just means the pack is rebuilt
+        try:
+            thumbnail_path = metadata_path.with_name(metadata.get("thumbnail") or "")
+        except (TypeError, ValueError):
+            return None
+        if not (zip_path.is_file() and thumbnail_path.is_file()):
+            return None
+        return zip_path, thumbnail_path, metadata_path
+        
     def calculate_content_hash(self, files_to_zip):
         """Calculate hash of all content to be zipped"""
-        hasher = hashlib.sha256()
+        ordered = sorted(files_to_zip)
         
-        for file_path in sorted(files_to_zip):
-            if file_path.is_file():
-                with open(file_path, 'rb') as f:
-                    hasher.update(f.read())
+        # hashlib releases the GIL while hashing, so large trees hash in parallel;
+        # small ones are done serially, where a pool costs more than it overlaps
+        total_bytes = sum(size for _, _, size, _ in ordered)
+        workers = os.cpu_count() or 1
+        if workers > 1 and total_bytes >= PARALLEL_HASH_MIN_BYTES:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                digests = list(executor.map(lambda f: _hash_file(f[0], f[2]), ordered))
+        else:
+            digests = [_hash_file(file_path, size) for file_path, _, size, _ in ordered]
+            
+        # Combine in sorted order so the root is independent of worker scheduling
+        hasher = hashlib.sha256()
+        for (file_path, *_), digest in zip(ordered, digests):
+            hasher.update(digest)
             hasher.update(str(file_path).encode())
             
         return hasher.hexdigest()
@@ -134,24 +244,37 @@ class SoulSketchZipCreator:
             "sdk/"
         ]
         
-        files_to_zip = []
-        for item in files_to_include:
-            item_path = self.repo_path / item
-            if item_path.exists():
-                if item_path.is_file():
-                    files_to_zip.append(item_path)
-                elif item_path.is_dir():
-                    files_to_zip.extend(item_path.rglob('*'))
+        files_to_zip = self.collect_files(files_to_include)
+        
+        # Skip hashing, zipping and thumbnail generation if nothing changed
+        content_signature = self.calculate_content_signature(files_to_zip)
+        unchanged = self.find_unchanged_pack(content_signature)
+        if unchanged:
+            print(f"♻️  No changes since {unchanged[0].name}; reusing existing pack")
+            return unchanged
         
         # Calculate content hash for unique thumbnail
         content_hash = self.calculate_content_hash(files_to_zip)
         
         # Create the zip file
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for file_path in files_to_zip:
-                if file_path.is_file():
-                    arcname = file_path.relative_to(self.repo_path)
-                    zipf.write(file_path, arcname)
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED,
+                             allowZip64=True, compresslevel=DEFLATE_LEVEL) as zipf:
+            for file_path, arcname, *_ in files_to_zip:
+                zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+                if file_path.suffix.lower() in STORED_SUFFIXES:
+                    zinfo.compress_type = zipfile.ZIP_STORED
+                else:
+                    zinfo.compress_type = zipfile.ZIP_DEFLATED
+                    # ZipFile.open takes the level from the entry, not the archive;
+                    # compress_level is public from 3.13, older versions only have
+                    # the private attribute ZipFile.write itself sets
+                    if sys.version_info >= (3, 13):
+                        zinfo.compress_level = DEFLATE_LEVEL
+                    else:
+                        zinfo._compresslevel = DEFLATE_LEVEL
+                # from_file records the size, so zipfile switches to Zip64 when needed
+                with open(file_path, 'rb') as src, zipf.open(zinfo, 'w') as dst:
+                    shutil.copyfileobj(src, dst, ZIP_COPY_BUFFER)
         
         # Generate unique thumbnail
         thumbnail_path = self.generate_unique_thumbnail(zip_path, content_hash)
@@ -161,7 +284,8 @@ class SoulSketchZipCreator:
             "created": datetime.now().isoformat(),
             "timestamp": self.timestamp,
             "content_hash": content_hash,
-            "file_count": len([f for f in files_to_zip if f.is_file()]),
+            "content_signature": content_signature,
+            "file_count": len(files_to_zip),
             "zip_size": zip_path.stat().st_size,
             "thumbnail": thumbnail_path.name,
             "project": "SoulSketch Protocol"
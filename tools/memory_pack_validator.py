@@ -7,12 +7,89 @@ Built on Alice's proven memory architecture.
 
 import json
 import os
+import stat
 import sys
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
-import re
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # optional speedup; the stdlib json module is the fallback
+    orjson = None
+
+try:
+    import ahocorasick
+except ImportError:  # optional; section checks fall back to one substring search each
+    ahocorasick = None
+
+# Recommended persona.md sections as (display name, lowercase needle) pairs
+_PERSONA_SECTIONS = tuple(
+    (section, section.lower())
+    for section in ('Identity', 'Tone', 'Behavior', 'Self-Understanding')
+)
+
+# With pyahocorasick, all persona sections are found in a single pass over the text
+if ahocorasick is not None:
+    _PERSONA_AUTOMATON = ahocorasick.Automaton()
+    for _section, _section_lower in _PERSONA_SECTIONS:
+        _PERSONA_AUTOMATON.add_word(_section_lower, _section)
+    _PERSONA_AUTOMATON.make_automaton()
+else:
+    _PERSONA_AUTOMATON = None
+
+def _json_loads(data):
+    """Parse one JSON document, using orjson when it is installed.
+    
+    Anything orjson rejects is retried with the stdlib parser, which also
+    accepts NaN/Infinity, so a pack's verdict never depends on orjson.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+def _json_dumps_indented(obj) -> bytes:
+    """Serialize with two-space indentation, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+def _opens_header(buf: bytes, pos: int) -> bool:
+    """True if the line at pos is a run of '#' followed by a space or tab."""
+    end = pos
+    while buf[end:end + 1] == b'#':
+        end += 1
+    return end > pos and buf[end:end + 1] in (b' ', b'\t')
+
+def _count_headers(buf: bytes) -> int:
+    """Count header lines: any number of '#' followed by a space or tab.
+    
+    Candidate lines are located with bytes.find, so only '#'-led lines are
+    inspected one byte at a time.
+    """
+    count = 1 if _opens_header(buf, 0) else 0
+    pos = buf.find(b'\n#')
+    while pos != -1:
+        if _opens_header(buf, pos + 1):
+            count += 1
+        pos = buf.find(b'\n#', pos + 2)
+    return count
+
+def _md_metrics(buf: bytes) -> Dict[str, int]:
+    """Header/word/line counts for a markdown file, computed on raw bytes.
+    
+    Counts come from C-level scans (bytes.find/count/split) rather than a
+    regex; see _count_headers for what counts as a header.
+    """
+    return {
+        'header_count': _count_headers(buf),
+        'word_count': len(buf.split()),
+        'line_count': buf.count(b'\n') + (0 if not buf or buf.endswith(b'\n') else 1)
+    }
+
 class MemoryPackValidator:
     """Validates SoulSketch memory pack structure and integrity."""
     
@@ -26,6 +103,8 @@ class MemoryPackValidator:
             'runtime_observations.jsonl': 'Living memory stream and insights'
         }
         self.validation_results = {}
+        # Markdown bytes read during the structure pass, reused by content validation
+        self._file_contents = {}
         
     def validate_all(self) -> Dict[str, any]:
         """Run complete validation suite."""
@@ -73,34 +152,75 @@ class MemoryPackValidator:
         
         structure_results = {}
         all_files_valid = True
+        # Per-file lines are written in one go rather than one print per file
+        report = []
+        
+        # One directory scan answers "does it exist / is it a file" for every name
+        try:
+            with os.scandir(self.memory_pack_path) as it:
+                entries = {entry.name: entry for entry in it}
+        except OSError:
+            entries = {}
         
         for filename, description in self.required_files.items():
             file_path = self.memory_pack_path / filename
             file_result = {
-                'exists': file_path.exists(),
+                'exists': True,
                 'readable': False,
                 'size_bytes': 0,
                 'description': description
             }
             
-            if file_result['exists']:
-                try:
-                    file_result['readable'] = file_path.is_file()
-                    file_result['size_bytes'] = file_path.stat().st_size
-                    print(f"  ✅ {filename} ({file_result['size_bytes']} bytes)")
-                except Exception as e:
-                    file_result['error'] = str(e)
-                    print(f"  ❌ {filename} - Error: {e}")
-                    all_files_valid = False
-            else:
-                print(f"  ❌ {filename} - Missing")
+            entry = entries.get(filename)
+            try:
+                if entry is None:
+                    raise FileNotFoundError(filename)
+                if filename.endswith('.md') and entry.is_file():
+                    st, data = self._read_file_once(file_path)
+                else:
+                    # JSONL is streamed later, so a stat is all that is needed now
+                    st, data = entry.stat(), None
+            except FileNotFoundError:
+                file_result['exists'] = False
+                report.append(f"  ❌ {filename} - Missing")
                 all_files_valid = False
+            except Exception as e:
+                file_result['error'] = str(e)
+                report.append(f"  ❌ {filename} - Error: {e}")
+                all_files_valid = False
+            else:
+                file_result['readable'] = stat.S_ISREG(st.st_mode)
+                file_result['size_bytes'] = st.st_size
+                if data is not None:
+                    self._file_contents[filename] = data
+                report.append(f"  ✅ {filename} ({file_result['size_bytes']} bytes)")
                 
             structure_results[filename] = file_result
             
+        if report:
+            sys.stdout.write("\n".join(report) + "\n")
         results['file_structure'] = structure_results
         return all_files_valid
     
+    @staticmethod
+    def _read_file_once(file_path: Path) -> Tuple[os.stat_result, Optional[bytes]]:
+        """Stat a pack file and read its content through a single descriptor."""
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            st = os.fstat(fd)
+            if not stat.S_ISREG(st.st_mode):
+                return st, None
+            data = os.read(fd, st.st_size)
+            # os.read may return short (e.g. very large files); finish the stat'ed size
+            while len(data) < st.st_size:
+                chunk = os.read(fd, st.st_size - len(data))
+                if not chunk:
+                    break
+                data += chunk
+            return st, data
+        finally:
+            os.close(fd)
+    
     def _validate_content_structure(self, results: Dict) -> bool:
         """Validate internal structure and format of each memory pack file."""
         print("\n📄 Validating Content Structure...")
@@ -108,61 +228,80 @@ class MemoryPackValidator:
         content_results = {}
         all_content_valid = True
         
-        for filename in self.required_files.keys():
-            file_path = self.memory_pack_path / filename
+        # Existence was established by the structure pass; no second stat per file
+        filenames = [
+            filename for filename, file_info in results['file_structure'].items()
+            if file_info['exists']
+        ]
+        
+        outcomes = [self._validate_one_file(filename) for filename in filenames]
             
-            if not file_path.exists():
-                continue
-                
-            try:
-                content = file_path.read_text(encoding='utf-8')
-                
-                if filename.endswith('.md'):
-                    validation = self._validate_markdown_structure(filename, content)
-                elif filename.endswith('.jsonl'):
-                    validation = self._validate_jsonl_structure(filename, content)
-                else:
-                    validation = {'valid': False, 'error': 'Unknown file type'}
-                
-                content_results[filename] = validation
-                
-                if validation['valid']:
-                    print(f"  ✅ {filename} - Structure valid")
-                else:
-                    print(f"  ❌ {filename} - {validation.get('error', 'Invalid structure')}")
-                    all_content_valid = False
-                    
-            except Exception as e:
-                content_results[filename] = {'valid': False, 'error': str(e)}
-                print(f"  ❌ {filename} - Error reading file: {e}")
+        # Report in the same order as required_files, with a single write
+        report = []
+        for filename, validation, read_error in outcomes:
+            content_results[filename] = validation
+            
+            if read_error is not None:
+                report.append(f"  ❌ {filename} - Error reading file: {read_error}")
+                all_content_valid = False
+            elif validation['valid']:
+                report.append(f"  ✅ {filename} - Structure valid")
+            else:
+                report.append(f"  ❌ {filename} - {validation.get('error', 'Invalid structure')}")
                 all_content_valid = False
                 
+        if report:
+            sys.stdout.write("\n".join(report) + "\n")
         results['content_validation'] = content_results
         return all_content_valid
     
-    def _validate_markdown_structure(self, filename: str, content: str) -> Dict:
+    def _validate_one_file(self, filename: str) -> Tuple[str, Dict, Optional[Exception]]:
+        """Read and validate a single memory pack file."""
+        file_path = self.memory_pack_path / filename
+        
+        try:
+            if filename.endswith('.md'):
+                data = self._file_contents.get(filename)
+                if data is None:
+                    data = file_path.read_bytes()
+                validation = self._validate_markdown_structure(filename, data)
+            elif filename.endswith('.jsonl'):
+                validation = self._validate_jsonl_file(filename, file_path)
+            else:
+                validation = {'valid': False, 'error': 'Unknown file type'}
+            return filename, validation, None
+            
+        except Exception as e:
+            return filename, {'valid': False, 'error': str(e)}, e
+    
+    def _validate_markdown_structure(self, filename: str, data: bytes) -> Dict:
         """Validate markdown file structure based on SoulSketch standards."""
         validation = {'valid': True, 'warnings': [], 'metrics': {}}
         
+        # Decoding bytes once skips text-mode buffering and newline translation
+        content = data.decode('utf-8')
+        
         # Check for required header structure
         if not content.strip().startswith('#'):
             validation['warnings'].append('Missing main header')
             
-        # Count sections and subsections
-        headers = re.findall(r'^#+\s+(.+)$', content, re.MULTILINE)
-        validation['metrics']['header_count'] = len(headers)
-        validation['metrics']['word_count'] = len(content.split())
-        validation['metrics']['line_count'] = len(content.splitlines())
+        # Count sections, words and lines straight from the bytes
+        validation['metrics'].update(_md_metrics(data))
         
-        # File-specific validations
+        # File-specific validations (case-insensitive, so lowercase once)
+        content_lower = content.lower()
         if filename == 'persona.md':
-            required_sections = ['Identity', 'Tone', 'Behavior', 'Self-Understanding']
-            for section in required_sections:
-                if section.lower() not in content.lower():
-                    validation['warnings'].append(f'Missing recommended section: {section}')
+            if _PERSONA_AUTOMATON is not None:
+                found = {section for _, section in _PERSONA_AUTOMATON.iter(content_lower)}
+                missing = [section for section, _ in _PERSONA_SECTIONS if section not in found]
+            else:
+                missing = [section for section, section_lower in _PERSONA_SECTIONS
+                           if section_lower not in content_lower]
+            for section in missing:
+                validation['warnings'].append(f'Missing recommended section: {section}')
                     
         elif filename == 'relationship_dynamics.md':
-            if 'john' not in content.lower():
+            if 'john' not in content_lower:
                 validation['warnings'].append('No reference to primary collaborator John')
                 
         elif filename == 'technical_domains.md':
@@ -171,26 +310,39 @@ class MemoryPackValidator:
                 
         return validation
     
-    def _validate_jsonl_structure(self, filename: str, content: str) -> Dict:
-        """Validate JSONL file structure for runtime observations."""
+    def _validate_jsonl_file(self, filename: str, file_path: Path) -> Dict:
+        """Validate JSONL file structure for runtime observations, streaming line by line."""
         validation = {'valid': True, 'warnings': [], 'metrics': {}}
         
-        lines = content.strip().split('\n')
+        # Counters reproduce the old content.strip().split('\n') metrics without
+        # holding the file: blank lines between observations count as lines
+        # (and so as invalid ones), leading and trailing blank lines do not
+        total_lines = 0
         valid_json_count = 0
+        pending_blank = 0
         
-        for i, line in enumerate(lines):
-            if not line.strip():
-                continue
-                
-            try:
-                json.loads(line)
-                valid_json_count += 1
-            except json.JSONDecodeError as e:
-                validation['warnings'].append(f'Invalid JSON on line {i+1}: {e}')
+        with file_path.open('rb') as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    if total_lines:
+                        pending_blank += 1
+                    continue
+                    
+                total_lines += pending_blank + 1
+                pending_blank = 0
                 
-        validation['metrics']['total_lines'] = len(lines)
+                try:
+                    _json_loads(line)
+                    valid_json_count += 1
+                # Covers orjson.JSONDecodeError and undecodable bytes for stdlib json
+                except ValueError as e:
+                    validation['warnings'].append(f'Invalid JSON on line {line_number}: {e}')
+                    
+        # An empty or all-blank file splits into a single empty line, as before
+        total_lines = total_lines or 1
+        validation['metrics']['total_lines'] = total_lines
         validation['metrics']['valid_json_lines'] = valid_json_count
-        validation['metrics']['invalid_lines'] = len(lines) - valid_json_count
+        validation['metrics']['invalid_lines'] = total_lines - valid_json_count
         
         if validation['metrics']['invalid_lines'] > 0:
             validation['valid'] = False
@@ -263,8 +415,8 @@ def main():
         
     # Save results to file
     results_file = Path(memory_pack_path) / 'validation_results.json'
-    with open(results_file, 'w') as f:
-        json.dump(results, f, indent=2)
+    with open(results_file, 'wb') as f:
+        f.write(_json_dumps_indented(results))
     print(f"\n📄 Detailed results saved to: {results_file}")
 
 if __name__ == "__main__":
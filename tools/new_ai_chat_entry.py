@@ -1,30 +1,16 @@
 #!/usr/bin/env python3
+import functools
 import os
 from pathlib import Path
 from datetime import datetime
 import subprocess
 
-def current_short_sha():
-    try:
-        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"]).decode().strip()
-    except Exception:
-        return "unknown"
+# Resolved once at import rather than on every main() call
+_ROOT = Path(__file__).resolve().parent.parent
+_OUTDIR = _ROOT / "project_space" / "Ai-chat"
 
-def main():
-    root = Path(__file__).parent.parent
-    outdir = root / "project_space" / "Ai-chat"
-    outdir.mkdir(parents=True, exist_ok=True)
-
-    ts = datetime.now().strftime("%Y-%m-%d-%H%M")
-    sha = current_short_sha()
-    fname = f"{ts}_commit-{sha}.md"
-    fpath = outdir / fname
-
-    if fpath.exists():
-        print(f"Exists: {fpath}")
-        return
-
-    template = f"""# Session: Untitled
+# Filled in with str.format_map; placeholders: {sha}
+_TEMPLATE = """# Session: Untitled
 
 - Participants: John (operator), Cassie (steward)
 - Commit: {sha}
@@ -41,7 +27,49 @@ def main():
 
 ## Next Steps
 """
-    fpath.write_text(template)
+
+# Cached per process for batch callers; call current_short_sha.cache_clear()
+# after committing if a fresh SHA is needed
+@functools.lru_cache(maxsize=1)
+def current_short_sha(root):
+    # Read HEAD straight from .git to avoid spawning git for a single hash
+    try:
+        git_dir = root / ".git"
+        head = (git_dir / "HEAD").read_text().strip()
+        if head.startswith("ref: "):
+            head = (git_dir / head[5:]).read_text().strip()
+        return head[:7]
+    except Exception:
+        pass
+    # Packed refs, worktrees (.git file), etc.: let git resolve it
+    try:
+        return subprocess.check_output(
+            ["git", "-C", str(root), "rev-parse", "--short", "HEAD"]
+        ).decode().strip()
+    except Exception:
+        return "unknown"
+
+def main():
+    _OUTDIR.mkdir(parents=True, exist_ok=True)
+
+    # Same "%Y-%m-%d-%H%M" stamp, formatted from the fields without strftime
+    n = datetime.now()
+    ts = f"{n.year:04d}-{n.month:02d}-{n.day:02d}-{n.hour:02d}{n.minute:02d}"
+    sha = current_short_sha(_ROOT)
+    fname = f"{ts}_commit-{sha}.md"
+    fpath = _OUTDIR / fname
+
+    template = _TEMPLATE.format_map({"sha": sha})
+    # O_EXCL makes the existence check and the create one atomic step
+    try:
+        fd = os.open(fpath, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+    except FileExistsError:
+        print(f"Exists: {fpath}")
+        return
+    try:
+        os.write(fd, template.encode())
+    finally:
+        os.close(fd)
     print(f"Created: {fpath}")
 
 if __name__ == "__main__":